@@ -1,56 +1,99 @@
 """
-All of these calls cross the FFI boundary.
+The address and math helpers are collected into a single `d.batch` call, so
+they cross the FFI boundary once instead of once per function.
 """
 
+import functools
+
 import driftpyrs as d
 
 AUTHORITY = "J1TnP8zvVxbtF5KFp5xRmWuvG9McnhzmBd9XGfCyuxFP"
 
-print("=== Program IDs ===")
-print(f"program_id:                 {d.get_program_id()}")
-print(f"vault_program_id:           {d.get_vault_program_id()}")
-print(f"jit_proxy_id:               {d.get_jit_proxy_id()}")
-print(f"token_program_id:           {d.get_token_program_id()}")
-print(f"token_2022_program_id:      {d.get_token_2022_program_id()}")
-print(f"associated_token_program:   {d.get_associated_token_program_id()}")
-
-print("\n=== State & Market PDAs ===")
-print(f"state_account:              {d.get_state_account()}")
-print(f"perp_market(0):             {d.derive_perp_market_account(0)}")
-print(f"spot_market(0):             {d.derive_spot_market_account(0)}")
-print(f"spot_market_vault(0):       {d.derive_spot_market_vault(0)}")
-print(f"drift_signer:               {d.derive_drift_signer()}")
-
-print("\n=== User PDAs ===")
-print(f"user_account(sub=0):        {d.derive_user_account(AUTHORITY, 0)}")
-print(f"user_account(sub=1):        {d.derive_user_account(AUTHORITY, 1)}")
-print(f"stats_account:              {d.derive_stats_account(AUTHORITY)}")
-print(f"swift_order_account:        {d.derive_swift_order_account(AUTHORITY)}")
-print(f"revenue_share:              {d.derive_revenue_share(AUTHORITY)}")
-print(f"revenue_share_escrow:       {d.derive_revenue_share_escrow(AUTHORITY)}")
-
-print("\n=== Oracle PDAs ===")
-print(f"pyth_lazer_oracle(6):       {d.derive_pyth_lazer_oracle(6)}")
-
-print("\n=== Math Functions ===")
-print(
-    f"standardize_price(1_000_500, 1000, 'long'):   {d.standardize_price(1_000_500, 1000, 'long')}"
-)
-print(
-    f"standardize_price(1_000_500, 1000, 'short'):  {d.standardize_price(1_000_500, 1000, 'short')}"
-)
-print(
-    f"standardize_price_i64(-500, 100, 'long'):     {d.standardize_price_i64(-500, 100, 'long')}"
-)
-print(
-    f"standardize_price_i64(-500, 100, 'short'):    {d.standardize_price_i64(-500, 100, 'short')}"
-)
-print(
-    f"standardize_base_asset_amount(1_500_000, 1_000_000):       {d.standardize_base_asset_amount(1_500_000, 1_000_000)}"
-)
-print(
-    f"standardize_base_asset_amount_ceil(1_500_000, 1_000_000):  {d.standardize_base_asset_amount_ceil(1_500_000, 1_000_000)}"
-)
+
+def call(op, args):
+    """Call the function an op names directly."""
+    return functools.reduce(getattr, op.split("."), d)(*args)
+
+
+def raised(fn, *args):
+    """Return the type of the exception fn(*args) raises."""
+    try:
+        fn(*args)
+    except Exception as e:
+        return type(e)
+    raise AssertionError(f"{fn.__name__}{args} did not raise")
+
+
+SECTIONS = [
+    (
+        "=== Program IDs ===",
+        [
+            ("program_id:                ", "get_program_id", ()),
+            ("vault_program_id:          ", "get_vault_program_id", ()),
+            ("jit_proxy_id:              ", "get_jit_proxy_id", ()),
+            ("token_program_id:          ", "get_token_program_id", ()),
+            ("token_2022_program_id:     ", "get_token_2022_program_id", ()),
+            ("associated_token_program:  ", "get_associated_token_program_id", ()),
+        ],
+    ),
+    (
+        "\n=== State & Market PDAs ===",
+        [
+            ("state_account:             ", "get_state_account", ()),
+            ("perp_market(0):            ", "derive_perp_market_account", (0,)),
+            ("spot_market(0):            ", "derive_spot_market_account", (0,)),
+            ("spot_market_vault(0):      ", "derive_spot_market_vault", (0,)),
+            ("drift_signer:              ", "derive_drift_signer", ()),
+        ],
+    ),
+    (
+        "\n=== User PDAs ===",
+        [
+            ("stats_account:             ", "derive_stats_account", (AUTHORITY,)),
+            ("swift_order_account:       ", "derive_swift_order_account", (AUTHORITY,)),
+            ("revenue_share:             ", "derive_revenue_share", (AUTHORITY,)),
+            ("revenue_share_escrow:      ", "derive_revenue_share_escrow", (AUTHORITY,)),
+        ],
+    ),
+    (
+        "\n=== Oracle PDAs ===",
+        [
+            ("pyth_lazer_oracle(6):      ", "derive_pyth_lazer_oracle", (6,)),
+        ],
+    ),
+    (
+        "\n=== Math Functions ===",
+        [
+            ("standardize_price(1_000_500, 1000, 'long'): ", "standardize_price", (1_000_500, 1000, "long")),
+            ("standardize_price(1_000_500, 1000, 'short'):", "standardize_price", (1_000_500, 1000, "short")),
+            ("standardize_price_i64(-500, 100, 'long'):   ", "standardize_price_i64", (-500, 100, "long")),
+            ("standardize_price_i64(-500, 100, 'short'):  ", "standardize_price_i64", (-500, 100, "short")),
+            ("standardize_base_asset_amount(1_500_000, 1_000_000):     ", "standardize_base_asset_amount", (1_500_000, 1_000_000)),
+            ("standardize_base_asset_amount_ceil(1_500_000, 1_000_000):", "standardize_base_asset_amount_ceil", (1_500_000, 1_000_000)),
+        ],
+    ),
+    (
+        "\n=== Pyth Lazer Mappings ===",
+        [
+            ("feed_id 6 -> perp market:  ", "pyth_lazer.feed_id_to_perp_market_index", (6,)),
+            ("perp market 0 -> feed_id:  ", "pyth_lazer.perp_market_index_to_feed_id", (0,)),
+            ("unknown feed_id 99999:     ", "pyth_lazer.feed_id_to_perp_market_index", (99999,)),
+        ],
+    ),
+]
+
+OPS = [(op, args) for _, ops in SECTIONS for _, op, args in ops]
+
+results = iter(d.batch(OPS))
+
+for title, ops in SECTIONS:
+    print(title)
+    for label, _, _ in ops:
+        print(f"{label} {next(results)}")
+
+print("\n=== User PDAs (batched sub-accounts) ===")
+for sub, account in enumerate(d.derive_user_accounts(AUTHORITY, range(2))):
+    print(f"user_account(sub={sub}):        {account}")
 
 print("\n=== URL Utils ===")
 print(
@@ -63,9 +106,21 @@ print(
     f"get_http_url('wss://api.mainnet.solana.com'):  {d.get_http_url('wss://api.mainnet.solana.com')}"
 )
 
-print("\n=== Pyth Lazer Mappings ===")
-print(f"feed_id 6 -> perp market:   {d.pyth_lazer.feed_id_to_perp_market_index(6)}")
-print(f"perp market 0 -> feed_id:   {d.pyth_lazer.perp_market_index_to_feed_id(0)}")
-print(f"unknown feed_id 99999:      {d.pyth_lazer.feed_id_to_perp_market_index(99999)}")
+print("\n=== Batch Checks ===")
+assert d.batch(OPS) == [call(op, args) for op, args in OPS]
+assert d.derive_user_accounts(AUTHORITY, [0, 1]) == [
+    d.derive_user_account(AUTHORITY, 0),
+    d.derive_user_account(AUTHORITY, 1),
+]
+for op, args in [
+    ("derive_user_account", ("not a pubkey", 0)),
+    ("derive_perp_market_account", (-1,)),
+    ("standardize_price", (1_000_500, 1000, "sideways")),
+    ("derive_stats_account", ("\ud800",)),
+]:
+    expected = raised(call, op, args)
+    actual = raised(d.batch, [(op, args)])
+    assert actual is expected, f"{op}: batch raised {actual.__name__}, direct call {expected.__name__}"
+print("batch matches the direct calls, including their exception types")
 
 print("\n✓ All functions called successfully!")
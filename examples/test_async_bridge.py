@@ -57,7 +57,25 @@ async def test_concurrent_async(driftpyrs):
     print(f"✓ Concurrent async works! 3 calls completed in {elapsed:.2f}s")
 
 
+async def test_batched_async(driftpyrs):
+    """Test that one batched call returns every result after a single sleep."""
+    print("\nTesting batched async call...")
+
+    start = time.time()
+    results = await driftpyrs.sleep_and_return_batch(50, 1)
+    elapsed = time.time() - start
+
+    assert len(results) == 50
+    assert all(r == "Slept for 1 seconds" for r in results)
+    assert elapsed < 1.2, f"Batched call took too long: {elapsed}s"
+
+    print(f"✓ Batched async works! 50 results in {elapsed:.2f}s")
+
+
 async def drive_console_load(driftpyrs, n: int, sleep_s: int, rounds: int):
+    # Keeps n separate calls per round: the point is to show n Tokio tasks
+    # in tokio-console, so this deliberately doesn't use the batched call.
+    expected = f"Slept for {sleep_s} seconds"
     for i in range(rounds):
         start = time.time()
         results = await asyncio.gather(
@@ -65,7 +83,7 @@ async def drive_console_load(driftpyrs, n: int, sleep_s: int, rounds: int):
         )
         elapsed = time.time() - start
         assert len(results) == n
-        assert all(r == f"Slept for {sleep_s} seconds" for r in results)
+        assert all(r == expected for r in results)
         print(f"✓ Load round {i + 1}/{rounds}: {n} tasks in {elapsed:.2f}s")
 
 
@@ -107,8 +125,15 @@ async def main():
 
     await test_basic_async(driftpyrs)
     await test_concurrent_async(driftpyrs)
+    await test_batched_async(driftpyrs)
     print("\n✓ All async bridge tests passed!")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop when it's installed; it cuts event loop overhead.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -2,7 +2,7 @@
 Test the cache pattern: sync reads, async background updates.
 
 This demonstrates:
-1. DashMap-based cache with lock-free concurrent access
+1. Atomic-backed cache with lock-free concurrent access
 2. Python reads synchronously (instant, no await)
 3. Tokio background tasks update cache asynchronously
 4. Separation of state access from update notification
@@ -23,6 +23,7 @@ async def test_cache_before_updates():
     assert demo.is_empty(), "Cache should be empty initially"
     assert demo.len() == 0, "Cache length should be 0"
     assert demo.get("counter") is None, "Counter should not exist yet"
+    assert demo.get_counter() is None, "Counter should not exist yet"
 
     print("✓ Cache is empty before updates start")
 
@@ -40,11 +41,9 @@ async def test_cache_sync_reads():
     await asyncio.sleep(0.3)
 
     # Now we can read synchronously - no await needed!
-    val1 = demo.get("counter")
-    assert val1 is not None, "Counter should exist after updates started"
-
-    # The value is a string representation of a number
-    counter1 = int(val1)
+    counter1 = demo.get_counter()
+    assert counter1 is not None, "Counter should exist after updates started"
+    assert demo.get("counter") is not None, "String read should agree"
     assert counter1 >= 0, f"Counter should be non-negative: {counter1}"
 
     print(f"✓ Synchronous read works! Counter = {counter1}")
@@ -89,7 +88,7 @@ async def test_no_await_for_reads():
     # These are all synchronous - no await
     start = time.perf_counter()
     for _ in range(1000):
-        _ = demo.get("counter")
+        _ = demo.get_counter()
     elapsed = time.perf_counter() - start
 
     # 1000 reads should be very fast (< 10ms) if truly synchronous
@@ -162,4 +161,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
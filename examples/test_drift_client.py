@@ -13,11 +13,8 @@ import os
 import driftpyrs
 
 
-async def test_client_connection():
-    """Test that we can connect to Drift protocol."""
-    print("Testing DriftClient connection...")
-
-    # Get RPC URL from environment variable
+def get_rpc_url() -> str:
+    """Read the RPC URL from the environment, falling back to the public RPC."""
     rpc_url = os.environ.get("RPC_URL")
     if not rpc_url:
         print("⚠ RPC_URL not set in environment")
@@ -25,11 +22,12 @@ async def test_client_connection():
         print("  Or create a .env file (see .env.example)")
         print("  Using default public RPC (may be slow)...")
         rpc_url = "https://api.mainnet-beta.solana.com"
+    return rpc_url
 
-    print(f"  RPC URL: {rpc_url[:50]}...")
 
-    # Connect (this is async - waits for connection to complete)
-    client = await driftpyrs.DriftClient.connect(rpc_url, context="mainnet")
+async def test_client_connection(client: driftpyrs.DriftClient):
+    """Test that we can connect to Drift protocol."""
+    print("Testing DriftClient connection...")
 
     print(f"✓ Connected: {client}")
     print(f"  Context: {client.context_name()}")
@@ -67,12 +65,10 @@ async def test_invalid_context():
         print(f"✓ Correctly raised ValueError: {e}")
 
 
-async def test_concurrent_connections():
+async def test_concurrent_connections(rpc_url: str):
     """Test that multiple clients can connect concurrently."""
     print("\nTesting concurrent connections...")
 
-    rpc_url = os.environ.get("RPC_URL", "https://api.mainnet-beta.solana.com")
-
     # Connect multiple clients concurrently
     clients = await asyncio.gather(
         driftpyrs.DriftClient.connect(rpc_url),
@@ -88,10 +84,16 @@ async def test_concurrent_connections():
 
 
 async def main():
-    await test_client_connection()
+    rpc_url = get_rpc_url()
+    print(f"RPC URL: {rpc_url[:50]}...")
+
+    # Connect once (this is async - waits for connection to complete)
+    client = await driftpyrs.DriftClient.connect(rpc_url, context="mainnet")
+
+    await test_client_connection(client)
     await test_devnet_connection()
     await test_invalid_context()
-    await test_concurrent_connections()
+    await test_concurrent_connections(rpc_url)
     print("\n✓ All DriftClient tests passed!")
 
 
@@ -99,4 +101,9 @@ if __name__ == "__main__":
     # Note: For production, use python-dotenv to load .env file
     # For testing, you can set RPC_URL manually:
     #   export RPC_URL='your-rpc-url'
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -8,46 +8,31 @@ This demonstrates the core architecture from ASYNC_ARCHITECTURE.md:
 """
 
 import asyncio
+import json
+import math
 import os
 import time
+from collections.abc import Mapping
 
 import driftpyrs
 
+RPC_URL = os.environ.get("RPC_URL", "https://api.mainnet-beta.solana.com")
 
-async def test_subscribe_and_read():
+
+async def test_subscribe_and_read(client: driftpyrs.DriftClient):
     """Test basic subscribe + read pattern."""
     print("Testing subscribe and read pattern...")
 
-    # Connect
-    rpc_url = os.environ.get("RPC_URL", "https://api.mainnet-beta.solana.com")
-    print(f"  Connecting to {rpc_url[:50]}...")
-    client = await driftpyrs.DriftClient.connect(rpc_url)
-    print(f"  ✓ Connected: {client.get_perp_market_count()} perp markets")
-
-    # Subscribe (spawns background tasks)
-    print("  Subscribing to all markets...")
-    await client.subscribe()
-    print("  ✓ Subscribed (background tasks running)")
-
-    # Wait for initial data to arrive
-    print("  Waiting for initial market data...")
-    await asyncio.sleep(1.0)
-
     # Now we can read synchronously!
     market = client.get_perp_market(0)
     assert market is not None, "Should have data after subscribing"
     print(f"  ✓ Sync read works! Market 0: {market['market_index']}")
 
 
-async def test_sync_reads_are_fast():
+async def test_sync_reads_are_fast(client: driftpyrs.DriftClient):
     """Test that reads are truly synchronous (instant)."""
     print("\nTesting that cache reads are instant...")
 
-    rpc_url = os.environ.get("RPC_URL", "https://api.mainnet-beta.solana.com")
-    client = await driftpyrs.DriftClient.connect(rpc_url)
-    await client.subscribe()
-    await asyncio.sleep(1.0)
-
     # Time 1000 reads - should be very fast if truly synchronous
     start = time.perf_counter()
     for _ in range(1000):
@@ -60,41 +45,31 @@ async def test_sync_reads_are_fast():
     print(f"  ✓ Reads are instant! (~{elapsed * 1000000 / 1000:.1f}µs per read)")
 
 
-async def test_market_data_updates():
+async def test_market_data_updates(client: driftpyrs.DriftClient):
     """Test that market data changes over time (background tasks updating)."""
     print("\nTesting that market data updates...")
 
-    rpc_url = os.environ.get("RPC_URL", "https://api.mainnet-beta.solana.com")
-    client = await driftpyrs.DriftClient.connect(rpc_url)
-    await client.subscribe()
-    await asyncio.sleep(1.0)
-
     # Read initial value
     market1 = client.get_perp_market(1)
     assert market1 is not None
-    funding_rate_1 = market1.get("amm_last_funding_rate")
+    funding_rate_1 = market1["amm"]["last_funding_rate"]
 
     print(f"  Initial read: funding_rate={funding_rate_1}")
     while True:
         await asyncio.sleep(0.5)
         market2 = client.get_perp_market(1)
         assert market2 is not None
-        funding_rate_2 = market2.get("amm_last_funding_rate")
+        funding_rate_2 = market2["amm"]["last_funding_rate"]
         print(f"  Current funding_rate={funding_rate_2}")
         if funding_rate_2 != funding_rate_1:
             print("  ✓ Market data is being updated by background tasks")
             break
 
 
-async def test_spot_markets():
+async def test_spot_markets(client: driftpyrs.DriftClient):
     """Test reading spot market data."""
     print("\nTesting spot market reads...")
 
-    rpc_url = os.environ.get("RPC_URL", "https://api.mainnet-beta.solana.com")
-    client = await driftpyrs.DriftClient.connect(rpc_url)
-    await client.subscribe()
-    await asyncio.sleep(1.0)
-
     # Read spot market (0 is usually USDC)
     spot = client.get_spot_market(0)
     assert spot is not None, "Should have spot market data"
@@ -103,100 +78,194 @@ async def test_spot_markets():
     print(f"    Borrow balance: {spot['borrow_balance']}")
 
 
-def _amm_price(market: dict) -> float:
-    return (market["amm_quote_asset_reserve"] * market["amm_peg_multiplier"]) / market[
-        "amm_base_asset_reserve"
-    ]
+async def test_amm_price(client: driftpyrs.DriftClient):
+    """Test the AMM price computed in Rust against the market's reserves."""
+    print("\nTesting AMM price...")
 
+    # Computed in Rust straight from the cached account, no dict built.
+    # Read back to back so a background update can't land in between.
+    amm = client.get_perp_market(0)["amm"]
+    amm_price = client.get_perp_amm_price(0)
+    assert amm_price is not None and amm_price > 0, "Should have an AMM price"
 
-async def test_poll_price():
-    """Poll oracle price a few times."""
-    print("\nTesting price polling...")
+    expected = (amm["quote_asset_reserve"] * amm["peg_multiplier"]) / amm["base_asset_reserve"]
+    assert math.isclose(amm_price, expected, rel_tol=1e-9), f"{amm_price} != {expected}"
+    assert client.get_perp_amm_price(65535) is None, "Unknown market should have no price"
+    print(f"  ✓ AMM price for market 0: {amm_price}")
 
-    rpc_url = os.environ.get("RPC_URL", "https://api.mainnet-beta.solana.com")
-    client = await driftpyrs.DriftClient.connect(rpc_url)
-    await client.subscribe()
-    await asyncio.sleep(1.0)
+
+async def test_poll_price(client: driftpyrs.DriftClient):
+    """Wait for a few oracle price updates."""
+    print("\nTesting price updates...")
+
+    # Every subscribed market has a cached oracle to read synchronously
+    for i in range(10):
+        oracle = client.get_perp_oracle(i)
+        assert oracle is not None, f"Should have an oracle for perp market {i}"
+        assert oracle["price"] != 0
+    print("  ✓ Sync oracle reads for perp markets 0-9")
 
     last = None
+    last_slot = 0
     changed = False
 
     for i in range(10):
-        oracle = client.get_perp_oracle(i)
-        assert oracle is not None
+        # Resolves as soon as the oracle has a newer slot - no sleep loop
+        oracle = await client.wait_for_perp_oracle_update(0, last_slot, timeout=30.0)
         print(f"  oracle: {oracle}")
         price = oracle["price"]
         assert price != 0
+        assert oracle["slot"] > last_slot, "update should be from a newer slot"
         if last is not None and price != last:
             changed = True
         last = price
-        print(f"  poll {i}: oracle_price={price} slot={oracle['slot']}")
-        await asyncio.sleep(0.5)
+        last_slot = oracle["slot"]
+        print(f"  update {i}: oracle_price={price} slot={last_slot}")
 
-    assert changed, "oracle price never changed during polling window"
+    assert changed, "oracle price never changed across updates"
 
+    try:
+        await client.wait_for_perp_oracle_update(65535)
+        assert False, "Unknown market should raise instead of waiting forever"
+    except ValueError:
+        pass
 
-async def test_multiple_markets():
+
+async def test_oracle_stream(client: driftpyrs.DriftClient):
+    """Consume oracle updates as an async stream until the price moves."""
+    print("\nTesting oracle stream...")
+
+    async def until_price_changes() -> int:
+        first = None
+        updates = 0
+        async for oracle in client.perp_oracle_stream(0):
+            updates += 1
+            print(f"  update {updates}: oracle_price={oracle['price']} slot={oracle['slot']}")
+            if first is None:
+                first = oracle["price"]
+            elif oracle["price"] != first:
+                return updates
+            assert updates < 100, "oracle price never changed across 100 updates"
+
+    updates = await asyncio.wait_for(until_price_changes(), timeout=60.0)
+    print(f"  ✓ Oracle stream delivered a price change after {updates} updates")
+
+    try:
+        client.perp_oracle_stream(65535)
+        assert False, "Unknown market should raise instead of never yielding"
+    except ValueError:
+        pass
+
+
+async def test_multiple_markets(client: driftpyrs.DriftClient):
     """Test reading multiple markets."""
     print("\nTesting multiple market reads...")
 
-    rpc_url = os.environ.get("RPC_URL", "https://api.mainnet-beta.solana.com")
-    client = await driftpyrs.DriftClient.connect(rpc_url)
-    await client.subscribe()
-    await asyncio.sleep(1.0)
-
-    # Read multiple markets
+    # Read multiple markets in a single call
     indices = client.get_perp_market_configs()
     print(f"  Reading {len(indices)} perp markets...")
 
-    count = 0
-    for idx in indices:
-        market = client.get_perp_market(idx)
-        if market is not None:
-            count += 1
+    markets = client.get_perp_markets(indices)
+    count = sum(market is not None for market in markets)
 
     print(f"  ✓ Successfully read {count}/{len(indices)} perp markets")
     assert count > 0, "Should have read at least one market"
 
+    # The view reads like the fully built dict
+    market = next(market for market in markets if market is not None)
+    full = market.as_dict()
+    assert isinstance(market, Mapping), "PerpMarketView should be a Mapping"
+    assert len(market) == len(full) and set(market) == set(full)
+    for key in ("market_index", "amm"):
+        assert market[key] == full[key], f"View and dict disagree on {key}"
+    assert dict(market.items()) == full
+    assert market.get(1) is None and 1 not in market, "Non-str keys should be missing"
+
+    # Views are shared between reads, so nested values must come out as copies
+    full["amm"]["last_funding_rate"] = -1
+    market["amm"]["last_funding_rate"] = -1
+    dict(market.items())["pnl_pool"]["scaled_balance"] = -1
+    again = client.get_perp_market(market["market_index"])
+    assert again["amm"]["last_funding_rate"] != -1, "Perp market read saw a caller's change"
+    assert again["pnl_pool"]["scaled_balance"] != -1, "Perp market read saw a caller's change"
+    print("  ✓ Perp market view matches its dict")
+
+    # Each spot read is a fresh dict, so changing one never leaks into the next
+    spot = client.get_spot_market(0)
+    assert spot is not None, "Should have spot market data"
+    json.dumps(spot)
+    spot["decimals"] = -1
+    spot["insurance_fund"]["total_shares"] = -1
+    fresh = client.get_spot_market(0)
+    assert fresh["decimals"] != -1, "Spot market read saw a caller's change"
+    assert fresh["insurance_fund"]["total_shares"] != -1, "Spot market read saw a caller's change"
+    print("  ✓ Spot market reads are independent dicts")
+
 
-async def test_concurrent_reads():
+async def test_concurrent_reads(client: driftpyrs.DriftClient):
     """Test that multiple tasks can read concurrently."""
     print("\nTesting concurrent reads from multiple tasks...")
 
-    rpc_url = os.environ.get("RPC_URL", "https://api.mainnet-beta.solana.com")
-    client = await driftpyrs.DriftClient.connect(rpc_url)
-    await client.subscribe()
-    await asyncio.sleep(1.0)
-
-    async def read_loop(name: str, count: int):
+    async def read_loop(count: int) -> int:
         """Task that reads markets in a loop."""
-        for _ in range(count):
-            _ = client.get_perp_market(0)
-            await asyncio.sleep(0.001)  # Small delay
-        print(f"    {name} completed {count} reads")
-
-    # Run multiple read tasks concurrently
-    await asyncio.gather(
-        read_loop("Task 1", 100),
-        read_loop("Task 2", 100),
-        read_loop("Task 3", 100),
-    )
+        reads = 0
+        for i in range(count):
+            if client.get_perp_market(0) is not None:
+                reads += 1
+            if i % 32 == 0:
+                await asyncio.sleep(0)  # Yield to the other tasks
+        return reads
+
+    # Run multiple read tasks concurrently; report once they're all done
+    start = time.perf_counter()
+    reads = await asyncio.gather(read_loop(100), read_loop(100), read_loop(100))
+    elapsed = time.perf_counter() - start
 
+    for i, count in enumerate(reads):
+        print(f"    Task {i + 1} completed {count} reads")
+    assert all(count == 100 for count in reads), f"Some reads missed: {reads}"
+    print(f"  {sum(reads)} reads in {elapsed * 1000:.2f}ms")
     print("  ✓ Concurrent reads work")
 
 
+async def connect_and_subscribe() -> driftpyrs.DriftClient:
+    """Connect and subscribe once; every test shares the resulting client."""
+    print(f"Connecting to {RPC_URL[:50]}...")
+    client = await driftpyrs.DriftClient.connect(RPC_URL)
+    print(f"✓ Connected: {client.get_perp_market_count()} perp markets")
+
+    # Subscribe (spawns background tasks)
+    print("Subscribing to all markets...")
+    await client.subscribe()
+    print("✓ Subscribed (background tasks running)")
+
+    # Wait for initial data to arrive
+    print("Waiting for initial market data...\n")
+    await asyncio.sleep(1.0)
+    return client
+
+
 async def main():
-    # await test_subscribe_and_read()
-    # await test_sync_reads_are_fast()
-    # await test_market_data_updates()
-    # await test_spot_markets()
-    await test_poll_price()
-    await test_multiple_markets()
-    await test_concurrent_reads()
+    client = await connect_and_subscribe()
+
+    # await test_subscribe_and_read(client)
+    # await test_sync_reads_are_fast(client)
+    # await test_market_data_updates(client)
+    # await test_spot_markets(client)
+    await test_amm_price(client)
+    await test_poll_price(client)
+    await test_oracle_stream(client)
+    await test_multiple_markets(client)
+    await test_concurrent_reads(client)
     print("\n✓ All subscription pattern tests passed!")
 
 
 if __name__ == "__main__":
     # Set RPC_URL environment variable
     #   export RPC_URL='your-rpc-url'
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,4 +1,7 @@
+from collections.abc import Mapping
+
 from driftpyrs._driftpyrs import (
+    batch,
     build_info,
     CacheDemo,
     derive_drift_signer,
@@ -11,6 +14,7 @@ from driftpyrs._driftpyrs import (
     derive_stats_account,
     derive_swift_order_account,
     derive_user_account,
+    derive_user_accounts,
     DriftClient,
     get_associated_token_program_id,
     get_http_url,
@@ -22,8 +26,11 @@ from driftpyrs._driftpyrs import (
     get_vault_program_id,
     get_ws_url,
     http_to_ws,
+    OracleStream,
+    PerpMarketView,
     pyth_lazer,
     sleep_and_return,
+    sleep_and_return_batch,
     standardize_base_asset_amount,
     standardize_base_asset_amount_ceil,
     standardize_price,
@@ -43,6 +50,7 @@ __all__ = [
     "derive_spot_market_vault",
     "derive_drift_signer",
     "derive_user_account",
+    "derive_user_accounts",
     "derive_stats_account",
     "derive_swift_order_account",
     "derive_pyth_lazer_oracle",
@@ -57,7 +65,14 @@ __all__ = [
     "get_http_url",
     "pyth_lazer",
     "sleep_and_return",
+    "sleep_and_return_batch",
+    "batch",
     "build_info",
     "CacheDemo",
     "DriftClient",
+    "OracleStream",
+    "PerpMarketView",
 ]
+
+# PerpMarketView is a read-only mapping; let isinstance(view, Mapping) see it
+Mapping.register(PerpMarketView)
@@ -1,48 +1,113 @@
 use drift_rs::constants::PROGRAM_ID;
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 use solana_sdk::pubkey::Pubkey;
 use std::str::FromStr;
 
-fn parse_pubkey(s: &str) -> PyResult<Pubkey> {
+/// Longest base58 encoding of a 32-byte pubkey.
+const MAX_BASE58_PUBKEY_LEN: usize = 44;
+
+pub(crate) fn parse_pubkey(s: &str) -> PyResult<Pubkey> {
     Pubkey::from_str(s).map_err(|e| PyValueError::new_err(format!("Invalid pubkey: {}", e)))
 }
 
+/// Base58-encode a pubkey into a stack buffer and build the Python string from
+/// it directly, skipping the heap-allocated `String` that `to_string` makes.
+pub(crate) fn pubkey_to_pystring<'py>(py: Python<'py>, key: &Pubkey) -> Bound<'py, PyString> {
+    let mut buf = [0u8; MAX_BASE58_PUBKEY_LEN];
+    let len = bs58::encode(key.as_ref())
+        .onto(&mut buf[..])
+        .expect("a 32-byte pubkey always fits in 44 base58 characters");
+    let encoded = std::str::from_utf8(&buf[..len]).expect("base58 output is ASCII");
+    PyString::new(py, encoded)
+}
+
+pub(crate) fn revenue_share_pda(authority: &Pubkey) -> Pubkey {
+    Pubkey::find_program_address(&[&b"REV_SHARE"[..], authority.as_ref()], &PROGRAM_ID).0
+}
+
+pub(crate) fn revenue_share_escrow_pda(authority: &Pubkey) -> Pubkey {
+    Pubkey::find_program_address(&[&b"REV_ESCROW"[..], authority.as_ref()], &PROGRAM_ID).0
+}
+
+#[pyfunction]
+pub fn derive_user_account<'py>(
+    py: Python<'py>,
+    authority: &str,
+    sub_account_id: u16,
+) -> PyResult<Bound<'py, PyString>> {
+    let authority = parse_pubkey(authority)?;
+    let account = drift_rs::Wallet::derive_user_account(&authority, sub_account_id);
+    Ok(pubkey_to_pystring(py, &account))
+}
+
+/// Derive user accounts for many sub-account ids in a single call.
+///
+/// Accepts any sequence of ints (including a NumPy integer array) and
+/// releases the GIL while the PDAs are derived.
 #[pyfunction]
-pub fn derive_user_account(authority: &str, sub_account_id: u16) -> PyResult<String> {
+pub fn derive_user_accounts<'py>(
+    py: Python<'py>,
+    authority: &str,
+    sub_account_ids: Vec<u16>,
+) -> PyResult<Vec<Bound<'py, PyString>>> {
     let authority = parse_pubkey(authority)?;
-    Ok(drift_rs::Wallet::derive_user_account(&authority, sub_account_id).to_string())
+    let accounts: Vec<Pubkey> = py.detach(|| {
+        sub_account_ids
+            .iter()
+            .map(|&id| drift_rs::Wallet::derive_user_account(&authority, id))
+            .collect()
+    });
+    Ok(accounts
+        .iter()
+        .map(|account| pubkey_to_pystring(py, account))
+        .collect())
 }
 
 #[pyfunction]
-pub fn derive_stats_account(authority: &str) -> PyResult<String> {
+pub fn derive_stats_account<'py>(
+    py: Python<'py>,
+    authority: &str,
+) -> PyResult<Bound<'py, PyString>> {
     let authority = parse_pubkey(authority)?;
-    Ok(drift_rs::Wallet::derive_stats_account(&authority).to_string())
+    let account = drift_rs::Wallet::derive_stats_account(&authority);
+    Ok(pubkey_to_pystring(py, &account))
 }
 
 #[pyfunction]
-pub fn derive_swift_order_account(authority: &str) -> PyResult<String> {
+pub fn derive_swift_order_account<'py>(
+    py: Python<'py>,
+    authority: &str,
+) -> PyResult<Bound<'py, PyString>> {
     let authority = parse_pubkey(authority)?;
-    Ok(drift_rs::Wallet::derive_swift_order_account(&authority).to_string())
+    let account = drift_rs::Wallet::derive_swift_order_account(&authority);
+    Ok(pubkey_to_pystring(py, &account))
 }
 
 #[pyfunction]
-pub fn derive_pyth_lazer_oracle(feed_id: u32) -> String {
-    drift_rs::utils::derive_pyth_lazer_oracle_public_key(feed_id).to_string()
+pub fn derive_pyth_lazer_oracle(py: Python<'_>, feed_id: u32) -> Bound<'_, PyString> {
+    let oracle = drift_rs::utils::derive_pyth_lazer_oracle_public_key(feed_id);
+    pubkey_to_pystring(py, &oracle)
 }
 
 #[pyfunction]
-pub fn derive_revenue_share(authority: &str) -> PyResult<String> {
+pub fn derive_revenue_share<'py>(
+    py: Python<'py>,
+    authority: &str,
+) -> PyResult<Bound<'py, PyString>> {
     let authority = parse_pubkey(authority)?;
-    let (account, _) =
-        Pubkey::find_program_address(&[&b"REV_SHARE"[..], authority.as_ref()], &PROGRAM_ID);
-    Ok(account.to_string())
+    Ok(pubkey_to_pystring(py, &revenue_share_pda(&authority)))
 }
 
 #[pyfunction]
-pub fn derive_revenue_share_escrow(authority: &str) -> PyResult<String> {
+pub fn derive_revenue_share_escrow<'py>(
+    py: Python<'py>,
+    authority: &str,
+) -> PyResult<Bound<'py, PyString>> {
     let authority = parse_pubkey(authority)?;
-    let (account, _) =
-        Pubkey::find_program_address(&[&b"REV_ESCROW"[..], authority.as_ref()], &PROGRAM_ID);
-    Ok(account.to_string())
+    Ok(pubkey_to_pystring(
+        py,
+        &revenue_share_escrow_pda(&authority),
+    ))
 }
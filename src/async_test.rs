@@ -33,3 +33,18 @@ pub fn sleep_and_return<'py>(py: Python<'py>, seconds: u64) -> PyResult<Bound<'p
         Ok(format!("Slept for {} seconds", seconds))
     })
 }
+
+/// Batched variant of `sleep_and_return`: sleeps once for the specified number
+/// of seconds and returns `n` copies of the message, so a single future
+/// crosses the bridge instead of `n`.
+#[pyfunction]
+pub fn sleep_and_return_batch<'py>(
+    py: Python<'py>,
+    n: usize,
+    seconds: u64,
+) -> PyResult<Bound<'py, PyAny>> {
+    pyo3_async_runtimes::tokio::future_into_py(py, async move {
+        tokio::time::sleep(tokio::time::Duration::from_secs(seconds)).await;
+        Ok(vec![format!("Slept for {} seconds", seconds); n])
+    })
+}
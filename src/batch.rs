@@ -0,0 +1,261 @@
+use crate::addresses::{
+    parse_pubkey, pubkey_to_pystring, revenue_share_escrow_pda, revenue_share_pda,
+};
+use crate::math::parse_direction;
+use drift_rs::constants;
+use drift_rs::types::PositionDirection;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::{PyList, PyTuple};
+use solana_sdk::pubkey::Pubkey;
+
+/// A single batched operation, parsed from a `(name, args)` tuple.
+///
+/// Arguments are validated up front (while holding the GIL) so that
+/// running the operation can't fail.
+enum Op {
+    ProgramId,
+    VaultProgramId,
+    JitProxyId,
+    TokenProgramId,
+    Token2022ProgramId,
+    AssociatedTokenProgramId,
+    StateAccount,
+    SpotMarketAccount(u16),
+    PerpMarketAccount(u16),
+    SpotMarketVault(u16),
+    DriftSigner,
+    UserAccount(Pubkey, u16),
+    StatsAccount(Pubkey),
+    SwiftOrderAccount(Pubkey),
+    PythLazerOracle(u32),
+    RevenueShare(Pubkey),
+    RevenueShareEscrow(Pubkey),
+    StandardizePrice(u64, u64, PositionDirection),
+    StandardizePriceI64(i64, u64, PositionDirection),
+    StandardizeBaseAssetAmount(u64, u64),
+    StandardizeBaseAssetAmountCeil(u64, u64),
+    FeedIdToPerpMarketIndex(u32),
+    PerpMarketIndexToFeedId(u16),
+}
+
+enum Value {
+    Pubkey(Pubkey),
+    U64(u64),
+    I64(i64),
+    OptU16(Option<u16>),
+    OptU32(Option<u32>),
+}
+
+impl<'py> IntoPyObject<'py> for Value {
+    type Target = PyAny;
+    type Output = Bound<'py, PyAny>;
+    type Error = PyErr;
+
+    fn into_pyobject(self, py: Python<'py>) -> PyResult<Self::Output> {
+        Ok(match self {
+            Value::Pubkey(key) => pubkey_to_pystring(py, &key).into_any(),
+            Value::U64(v) => v.into_pyobject(py)?.into_any(),
+            Value::I64(v) => v.into_pyobject(py)?.into_any(),
+            Value::OptU16(v) => v.into_pyobject(py)?,
+            Value::OptU32(v) => v.into_pyobject(py)?,
+        })
+    }
+}
+
+fn no_args(name: &str, args: &Bound<'_, PyTuple>) -> PyResult<()> {
+    if args.is_empty() {
+        Ok(())
+    } else {
+        Err(PyValueError::new_err(format!(
+            "'{}' takes no arguments ({} given)",
+            name,
+            args.len()
+        )))
+    }
+}
+
+fn parse_op(name: &str, args: &Bound<'_, PyTuple>) -> PyResult<Op> {
+    let op = match name {
+        "get_program_id" => no_args(name, args).map(|_| Op::ProgramId)?,
+        "get_vault_program_id" => no_args(name, args).map(|_| Op::VaultProgramId)?,
+        "get_jit_proxy_id" => no_args(name, args).map(|_| Op::JitProxyId)?,
+        "get_token_program_id" => no_args(name, args).map(|_| Op::TokenProgramId)?,
+        "get_token_2022_program_id" => no_args(name, args).map(|_| Op::Token2022ProgramId)?,
+        "get_associated_token_program_id" => {
+            no_args(name, args).map(|_| Op::AssociatedTokenProgramId)?
+        }
+        "get_state_account" => no_args(name, args).map(|_| Op::StateAccount)?,
+        "derive_spot_market_account" => {
+            let (market_index,) = args.extract::<(u16,)>()?;
+            Op::SpotMarketAccount(market_index)
+        }
+        "derive_perp_market_account" => {
+            let (market_index,) = args.extract::<(u16,)>()?;
+            Op::PerpMarketAccount(market_index)
+        }
+        "derive_spot_market_vault" => {
+            let (market_index,) = args.extract::<(u16,)>()?;
+            Op::SpotMarketVault(market_index)
+        }
+        "derive_drift_signer" => no_args(name, args).map(|_| Op::DriftSigner)?,
+        "derive_user_account" => {
+            let (authority, sub_account_id) = args.extract::<(String, u16)>()?;
+            Op::UserAccount(parse_pubkey(&authority)?, sub_account_id)
+        }
+        "derive_stats_account" => {
+            let (authority,) = args.extract::<(String,)>()?;
+            Op::StatsAccount(parse_pubkey(&authority)?)
+        }
+        "derive_swift_order_account" => {
+            let (authority,) = args.extract::<(String,)>()?;
+            Op::SwiftOrderAccount(parse_pubkey(&authority)?)
+        }
+        "derive_pyth_lazer_oracle" => {
+            let (feed_id,) = args.extract::<(u32,)>()?;
+            Op::PythLazerOracle(feed_id)
+        }
+        "derive_revenue_share" => {
+            let (authority,) = args.extract::<(String,)>()?;
+            Op::RevenueShare(parse_pubkey(&authority)?)
+        }
+        "derive_revenue_share_escrow" => {
+            let (authority,) = args.extract::<(String,)>()?;
+            Op::RevenueShareEscrow(parse_pubkey(&authority)?)
+        }
+        "standardize_price" => {
+            let (price, tick_size, direction) = args.extract::<(u64, u64, String)>()?;
+            Op::StandardizePrice(price, tick_size, parse_direction(&direction)?)
+        }
+        "standardize_price_i64" => {
+            let (price, tick_size, direction) = args.extract::<(i64, u64, String)>()?;
+            Op::StandardizePriceI64(price, tick_size, parse_direction(&direction)?)
+        }
+        "standardize_base_asset_amount" => {
+            let (base_asset_amount, step_size) = args.extract::<(u64, u64)>()?;
+            Op::StandardizeBaseAssetAmount(base_asset_amount, step_size)
+        }
+        "standardize_base_asset_amount_ceil" => {
+            let (base_asset_amount, step_size) = args.extract::<(u64, u64)>()?;
+            Op::StandardizeBaseAssetAmountCeil(base_asset_amount, step_size)
+        }
+        "pyth_lazer.feed_id_to_perp_market_index" => {
+            let (feed_id,) = args.extract::<(u32,)>()?;
+            Op::FeedIdToPerpMarketIndex(feed_id)
+        }
+        "pyth_lazer.perp_market_index_to_feed_id" => {
+            let (market_index,) = args.extract::<(u16,)>()?;
+            Op::PerpMarketIndexToFeedId(market_index)
+        }
+        _ => {
+            return Err(PyValueError::new_err(format!(
+                "Unknown batch operation '{}'",
+                name
+            )))
+        }
+    };
+    Ok(op)
+}
+
+impl Op {
+    fn run(self) -> Value {
+        match self {
+            Op::ProgramId => Value::Pubkey(constants::PROGRAM_ID),
+            Op::VaultProgramId => Value::Pubkey(constants::VAULT_PROGRAM_ID),
+            Op::JitProxyId => Value::Pubkey(constants::JIT_PROXY_ID),
+            Op::TokenProgramId => Value::Pubkey(constants::TOKEN_PROGRAM_ID),
+            Op::Token2022ProgramId => Value::Pubkey(constants::TOKEN_2022_PROGRAM_ID),
+            Op::AssociatedTokenProgramId => Value::Pubkey(constants::ASSOCIATED_TOKEN_PROGRAM_ID),
+            Op::StateAccount => Value::Pubkey(*constants::state_account()),
+            Op::SpotMarketAccount(market_index) => {
+                Value::Pubkey(constants::derive_spot_market_account(market_index))
+            }
+            Op::PerpMarketAccount(market_index) => {
+                Value::Pubkey(constants::derive_perp_market_account(market_index))
+            }
+            Op::SpotMarketVault(market_index) => {
+                Value::Pubkey(constants::derive_spot_market_vault(market_index))
+            }
+            Op::DriftSigner => Value::Pubkey(constants::derive_drift_signer()),
+            Op::UserAccount(authority, sub_account_id) => Value::Pubkey(
+                drift_rs::Wallet::derive_user_account(&authority, sub_account_id),
+            ),
+            Op::StatsAccount(authority) => {
+                Value::Pubkey(drift_rs::Wallet::derive_stats_account(&authority))
+            }
+            Op::SwiftOrderAccount(authority) => {
+                Value::Pubkey(drift_rs::Wallet::derive_swift_order_account(&authority))
+            }
+            Op::PythLazerOracle(feed_id) => Value::Pubkey(
+                drift_rs::utils::derive_pyth_lazer_oracle_public_key(feed_id),
+            ),
+            Op::RevenueShare(authority) => Value::Pubkey(revenue_share_pda(&authority)),
+            Op::RevenueShareEscrow(authority) => {
+                Value::Pubkey(revenue_share_escrow_pda(&authority))
+            }
+            Op::StandardizePrice(price, tick_size, direction) => Value::U64(
+                drift_rs::math::standardize_price(price, tick_size, direction),
+            ),
+            Op::StandardizePriceI64(price, tick_size, direction) => Value::I64(
+                drift_rs::math::standardize_price_i64(price, tick_size, direction),
+            ),
+            Op::StandardizeBaseAssetAmount(base_asset_amount, step_size) => Value::U64(
+                drift_rs::math::standardize_base_asset_amount(base_asset_amount, step_size),
+            ),
+            Op::StandardizeBaseAssetAmountCeil(base_asset_amount, step_size) => Value::U64(
+                drift_rs::math::standardize_base_asset_amount_ceil(base_asset_amount, step_size),
+            ),
+            Op::FeedIdToPerpMarketIndex(feed_id) => {
+                Value::OptU16(constants::pyth_lazer_feed_id_to_perp_market_index(feed_id))
+            }
+            Op::PerpMarketIndexToFeedId(market_index) => Value::OptU32(
+                constants::perp_market_index_to_pyth_lazer_feed_id(market_index),
+            ),
+        }
+    }
+}
+
+/// Run many address/math helpers in a single call.
+///
+/// Takes a list of `(name, args)` tuples, where `name` is the name of a
+/// module-level function (e.g. `"derive_user_account"`, or
+/// `"pyth_lazer.feed_id_to_perp_market_index"` for the submodule) and `args`
+/// is the tuple of its positional arguments. Returns the results in order.
+///
+/// All arguments are validated before anything runs, and the GIL is released
+/// while the operations execute. An invalid op raises the exception the direct
+/// function call would; on Python 3.11+ it carries a note naming the op.
+///
+/// Example:
+///     ```python
+///     program_id, user = driftpyrs.batch([
+///         ("get_program_id", ()),
+///         ("derive_user_account", (authority, 0)),
+///     ])
+///     ```
+#[pyfunction]
+pub fn batch<'py>(
+    py: Python<'py>,
+    ops: Vec<(String, Bound<'py, PyTuple>)>,
+) -> PyResult<Bound<'py, PyList>> {
+    let ops = ops
+        .iter()
+        .enumerate()
+        .map(|(i, (name, args))| {
+            parse_op(name, args).map_err(|e| {
+                // Re-raise the original exception so its type, args and
+                // traceback match the direct call; only note which op failed.
+                if py.version_info() >= (3, 11) {
+                    let note = format!("in batch op {} ('{}')", i, name);
+                    // A failed add_note leaves the original error to raise
+                    let _ = e.value(py).call_method1("add_note", (note,));
+                }
+                e
+            })
+        })
+        .collect::<PyResult<Vec<_>>>()?;
+
+    let values = py.detach(|| ops.into_iter().map(Op::run).collect::<Vec<_>>());
+
+    PyList::new(py, values)
+}
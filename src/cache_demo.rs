@@ -1,16 +1,31 @@
-use dashmap::DashMap;
 use pyo3::prelude::*;
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::Arc;
 
+const COUNTER_KEY: &str = "counter";
+
+/// Sentinel stored in the counter slot while it has no value.
+const EMPTY: u64 = u64::MAX;
+
 /// Demonstrates the cache pattern: synchronous reads, async background updates.
 ///
 /// This class shows the core architectural pattern for driftpyrs:
 /// - Python reads from the cache synchronously (instant, no await)
 /// - Tokio background tasks write to the cache asynchronously
-/// - DashMap provides lock-free concurrent access
+/// - The only cached value is a counter, kept in an atomic slot, so reads
+///   and writes are a single lock-free load/store
 #[pyclass]
 pub struct CacheDemo {
-    cache: Arc<DashMap<String, String>>,
+    counter: Arc<AtomicU64>,
+}
+
+impl CacheDemo {
+    fn counter(&self) -> Option<u64> {
+        match self.counter.load(Ordering::Relaxed) {
+            EMPTY => None,
+            value => Some(value),
+        }
+    }
 }
 
 #[pymethods]
@@ -21,31 +36,46 @@ impl CacheDemo {
         tracing::info!("CacheDemo::new - creating new instance");
 
         Self {
-            cache: Arc::new(DashMap::new()),
+            counter: Arc::new(AtomicU64::new(EMPTY)),
         }
     }
 
-    /// Get a value from the cache synchronously.
+    /// Get the counter synchronously as an int, or None before the first update.
+    /// This is a single atomic load - no hashing, no allocation.
+    fn get_counter(&self) -> Option<u64> {
+        self.counter()
+    }
+
+    /// Get a value from the cache synchronously, as a string.
     /// This is instant - no await needed, just reads from memory.
     fn get(&self, key: &str) -> Option<String> {
-        self.cache.get(key).map(|v| v.clone())
+        if key == COUNTER_KEY {
+            self.counter().map(|value| value.to_string())
+        } else {
+            None
+        }
     }
 
     /// Start background updates to the cache.
     /// This spawns a Tokio task that updates the cache every 100ms.
     /// Returns immediately once the background task is spawned.
     fn start_updates<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
-        let cache = Arc::clone(&self.cache);
+        let cache = Arc::clone(&self.counter);
 
         pyo3_async_runtimes::tokio::future_into_py(py, async move {
             #[cfg(feature = "observability")]
             tracing::info!("start_updates - spawning background task");
 
-            // Spawn background task that runs forever
+            // Spawn background task that runs forever. Ticks missed while the
+            // runtime is busy are skipped rather than fired back-to-back.
             tokio::spawn(async move {
+                let mut ticker = tokio::time::interval(tokio::time::Duration::from_millis(100));
+                ticker.set_missed_tick_behavior(tokio::time::MissedTickBehavior::Skip);
+
                 let mut counter = 0u64;
                 loop {
-                    cache.insert("counter".to_string(), counter.to_string());
+                    ticker.tick().await;
+                    cache.store(counter, Ordering::Relaxed);
 
                     #[cfg(feature = "observability")]
                     if counter % 10 == 0 {
@@ -53,7 +83,6 @@ impl CacheDemo {
                     }
 
                     counter += 1;
-                    tokio::time::sleep(tokio::time::Duration::from_millis(100)).await;
                 }
             });
 
@@ -66,21 +95,23 @@ impl CacheDemo {
 
     /// Get all keys in the cache.
     fn keys(&self) -> Vec<String> {
-        self.cache.iter().map(|entry| entry.key().clone()).collect()
+        self.counter()
+            .map(|_| vec![COUNTER_KEY.to_string()])
+            .unwrap_or_default()
     }
 
     /// Get the number of entries in the cache.
     fn len(&self) -> usize {
-        self.cache.len()
+        usize::from(self.counter().is_some())
     }
 
     /// Check if the cache is empty.
     fn is_empty(&self) -> bool {
-        self.cache.is_empty()
+        self.counter().is_none()
     }
 
     /// Clear all entries from the cache.
     fn clear(&self) {
-        self.cache.clear();
+        self.counter.store(EMPTY, Ordering::Relaxed);
     }
 }
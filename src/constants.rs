@@ -1,57 +1,59 @@
+use crate::addresses::pubkey_to_pystring;
 use drift_rs::constants;
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 
 #[pyfunction]
-pub fn get_program_id() -> String {
-    constants::PROGRAM_ID.to_string()
+pub fn get_program_id(py: Python<'_>) -> Bound<'_, PyString> {
+    pubkey_to_pystring(py, &constants::PROGRAM_ID)
 }
 
 #[pyfunction]
-pub fn get_vault_program_id() -> String {
-    constants::VAULT_PROGRAM_ID.to_string()
+pub fn get_vault_program_id(py: Python<'_>) -> Bound<'_, PyString> {
+    pubkey_to_pystring(py, &constants::VAULT_PROGRAM_ID)
 }
 
 #[pyfunction]
-pub fn get_jit_proxy_id() -> String {
-    constants::JIT_PROXY_ID.to_string()
+pub fn get_jit_proxy_id(py: Python<'_>) -> Bound<'_, PyString> {
+    pubkey_to_pystring(py, &constants::JIT_PROXY_ID)
 }
 
 #[pyfunction]
-pub fn get_token_program_id() -> String {
-    constants::TOKEN_PROGRAM_ID.to_string()
+pub fn get_token_program_id(py: Python<'_>) -> Bound<'_, PyString> {
+    pubkey_to_pystring(py, &constants::TOKEN_PROGRAM_ID)
 }
 
 #[pyfunction]
-pub fn get_token_2022_program_id() -> String {
-    constants::TOKEN_2022_PROGRAM_ID.to_string()
+pub fn get_token_2022_program_id(py: Python<'_>) -> Bound<'_, PyString> {
+    pubkey_to_pystring(py, &constants::TOKEN_2022_PROGRAM_ID)
 }
 
 #[pyfunction]
-pub fn get_associated_token_program_id() -> String {
-    constants::ASSOCIATED_TOKEN_PROGRAM_ID.to_string()
+pub fn get_associated_token_program_id(py: Python<'_>) -> Bound<'_, PyString> {
+    pubkey_to_pystring(py, &constants::ASSOCIATED_TOKEN_PROGRAM_ID)
 }
 
 #[pyfunction]
-pub fn get_state_account() -> String {
-    constants::state_account().to_string()
+pub fn get_state_account(py: Python<'_>) -> Bound<'_, PyString> {
+    pubkey_to_pystring(py, constants::state_account())
 }
 
 #[pyfunction]
-pub fn derive_spot_market_account(market_index: u16) -> String {
-    constants::derive_spot_market_account(market_index).to_string()
+pub fn derive_spot_market_account(py: Python<'_>, market_index: u16) -> Bound<'_, PyString> {
+    pubkey_to_pystring(py, &constants::derive_spot_market_account(market_index))
 }
 
 #[pyfunction]
-pub fn derive_perp_market_account(market_index: u16) -> String {
-    constants::derive_perp_market_account(market_index).to_string()
+pub fn derive_perp_market_account(py: Python<'_>, market_index: u16) -> Bound<'_, PyString> {
+    pubkey_to_pystring(py, &constants::derive_perp_market_account(market_index))
 }
 
 #[pyfunction]
-pub fn derive_spot_market_vault(market_index: u16) -> String {
-    constants::derive_spot_market_vault(market_index).to_string()
+pub fn derive_spot_market_vault(py: Python<'_>, market_index: u16) -> Bound<'_, PyString> {
+    pubkey_to_pystring(py, &constants::derive_spot_market_vault(market_index))
 }
 
 #[pyfunction]
-pub fn derive_drift_signer() -> String {
-    constants::derive_drift_signer().to_string()
+pub fn derive_drift_signer(py: Python<'_>) -> Bound<'_, PyString> {
+    pubkey_to_pystring(py, &constants::derive_drift_signer())
 }
@@ -1,12 +1,157 @@
+use crate::market_view::{pythonize_market, PerpMarketView};
+use dashmap::DashMap;
+use drift_rs::types::accounts::PerpMarket;
+use drift_rs::types::MarketId;
 use pyo3::prelude::*;
 use pythonize::pythonize;
 use solana_sdk::pubkey::Pubkey;
 use std::str::FromStr;
 use std::sync::Arc;
+use std::time::Duration;
+
+/// How often oracle waiters re-check the cache for a newer slot.
+const ORACLE_POLL_INTERVAL: Duration = Duration::from_millis(50);
+
+/// Python objects built from market accounts, keyed by market index.
+///
+/// Each entry keeps the account it was built from, so the object is only
+/// rebuilt when the background subscription has written a new account.
+type MarketObjectCache<T> = DashMap<u16, (T, Py<PyAny>), foldhash::fast::RandomState>;
 
 #[pyclass]
 pub struct DriftClient {
     inner: Arc<drift_rs::DriftClient>,
+    perp_market_objects: MarketObjectCache<PerpMarket>,
+}
+
+/// Return the cached Python object for `market`, rebuilding it with `build` if
+/// the account has changed since it was last converted.
+fn cached_market_object<T: Copy + PartialEq>(
+    py: Python<'_>,
+    cache: &MarketObjectCache<T>,
+    market_index: u16,
+    market: T,
+    build: impl FnOnce(Python<'_>, T) -> PyResult<Py<PyAny>>,
+) -> PyResult<Py<PyAny>> {
+    if let Some(entry) = cache.get(&market_index) {
+        if entry.0 == market {
+            return Ok(entry.1.clone_ref(py));
+        }
+    }
+
+    let obj = build(py, market)?;
+    cache.insert(market_index, (market, obj.clone_ref(py)));
+    Ok(obj)
+}
+
+fn build_perp_market_view(py: Python<'_>, market: PerpMarket) -> PyResult<Py<PyAny>> {
+    Ok(Py::new(py, PerpMarketView::new(market))?.into_any())
+}
+
+/// The oracle fields exposed to Python, copied out of the drift-rs cache.
+#[derive(Clone, Copy)]
+struct OracleSnapshot {
+    price: i64,
+    confidence: u64,
+    delay: i64,
+    slot: u64,
+}
+
+impl OracleSnapshot {
+    fn read(client: &drift_rs::DriftClient, market: MarketId) -> Option<Self> {
+        client
+            .try_get_oracle_price_data_and_slot(market)
+            .map(|oracle| Self {
+                price: oracle.data.price,
+                confidence: oracle.data.confidence,
+                delay: oracle.data.delay,
+                slot: oracle.slot,
+            })
+    }
+
+    fn to_dict(self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        let dict = pyo3::types::PyDict::new(py);
+        dict.set_item("price", self.price)?;
+        dict.set_item("confidence", self.confidence)?;
+        dict.set_item("delay", self.delay)?;
+        dict.set_item("slot", self.slot)?;
+        Ok(dict.into_any().unbind())
+    }
+}
+
+/// Wait until the cached oracle for `market` is from a slot after `since_slot`.
+///
+/// The check runs on the Tokio side, so Python is only woken once there is an
+/// update to hand back.
+async fn next_oracle_update(
+    client: &drift_rs::DriftClient,
+    market: MarketId,
+    since_slot: u64,
+) -> OracleSnapshot {
+    let mut ticker = tokio::time::interval(ORACLE_POLL_INTERVAL);
+    ticker.set_missed_tick_behavior(tokio::time::MissedTickBehavior::Skip);
+    loop {
+        ticker.tick().await;
+        if let Some(oracle) = OracleSnapshot::read(client, market) {
+            if oracle.slot > since_slot {
+                return oracle;
+            }
+        }
+    }
+}
+
+/// Async iterator over oracle updates for one market.
+///
+/// Each `__anext__` resolves with the next oracle dict from a newer slot than
+/// the one it last returned. drift-rs doesn't notify on oracle writes, so each
+/// stream polls the cache on its own 50ms interval while waiting. The stream
+/// never ends on its own.
+#[pyclass]
+pub struct OracleStream {
+    inner: Arc<drift_rs::DriftClient>,
+    market: MarketId,
+    last_slot: Arc<tokio::sync::Mutex<u64>>,
+}
+
+#[pymethods]
+impl OracleStream {
+    fn __aiter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __anext__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let inner = Arc::clone(&self.inner);
+        let market = self.market;
+        let last_slot = Arc::clone(&self.last_slot);
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            // Held across the wait so concurrent consumers each get a distinct update
+            let mut last_slot = last_slot.lock().await;
+            let oracle = next_oracle_update(&inner, market, *last_slot).await;
+            *last_slot = oracle.slot;
+            Python::attach(|py| oracle.to_dict(py))
+        })
+    }
+}
+
+impl DriftClient {
+    /// The perp `MarketId` for `market_index`, or ValueError if the client
+    /// has no such market (its oracle would never update).
+    fn perp_market_id(&self, market_index: u16) -> PyResult<MarketId> {
+        let known = self
+            .inner
+            .get_all_perp_market_ids()
+            .iter()
+            .any(|market| market.index() == market_index);
+        if known {
+            Ok(MarketId::perp(market_index))
+        } else {
+            Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "Unknown perp market index: {}",
+                market_index
+            )))
+        }
+    }
 }
 
 #[pymethods]
@@ -52,6 +197,7 @@ impl DriftClient {
 
             Ok(DriftClient {
                 inner: Arc::new(client),
+                perp_market_objects: DashMap::with_hasher(Default::default()),
             })
         })
     }
@@ -96,6 +242,8 @@ impl DriftClient {
     /// get_spot_market() to read from the cache synchronously (no await).
     ///
     /// Returns when subscription is established (background tasks are running).
+    /// The initial fetches run on the Tokio runtime without holding the GIL, so
+    /// other coroutines keep running while they complete.
     ///
     /// Example:
     ///     ```python
@@ -110,19 +258,25 @@ impl DriftClient {
             #[cfg(feature = "observability")]
             tracing::info!("DriftClient::subscribe starting");
 
-            inner.subscribe_all_markets().await.map_err(|e| {
-                pyo3::exceptions::PyRuntimeError::new_err(format!(
-                    "Failed to subscribe to markets: {}",
-                    e
-                ))
-            })?;
-
-            inner.subscribe_all_oracles().await.map_err(|e| {
-                pyo3::exceptions::PyRuntimeError::new_err(format!(
-                    "Failed to subscribe to oracles: {}",
-                    e
-                ))
-            })?;
+            // Markets and oracles are independent subscriptions, so establish
+            // them concurrently rather than waiting on one before the other.
+            let markets = async {
+                inner.subscribe_all_markets().await.map_err(|e| {
+                    pyo3::exceptions::PyRuntimeError::new_err(format!(
+                        "Failed to subscribe to markets: {}",
+                        e
+                    ))
+                })
+            };
+            let oracles = async {
+                inner.subscribe_all_oracles().await.map_err(|e| {
+                    pyo3::exceptions::PyRuntimeError::new_err(format!(
+                        "Failed to subscribe to oracles: {}",
+                        e
+                    ))
+                })
+            };
+            tokio::try_join!(markets, oracles)?;
 
             #[cfg(feature = "observability")]
             tracing::info!(
@@ -134,65 +288,168 @@ impl DriftClient {
     }
 
     fn get_perp_oracle(&self, py: Python<'_>, market_index: u16) -> PyResult<Option<Py<PyAny>>> {
-        match self
-            .inner
-            .try_get_oracle_price_data_and_slot(drift_rs::types::MarketId::perp(market_index))
-        {
-            Some(oracle) => {
-                let dict = pyo3::types::PyDict::new(py);
-                dict.set_item("price", oracle.data.price)?;
-                dict.set_item("confidence", oracle.data.confidence)?;
-                dict.set_item("delay", oracle.data.delay)?;
-                dict.set_item("slot", oracle.slot)?;
-                Ok(Some(dict.into_any().unbind()))
-            }
-            None => Ok(None),
-        }
+        OracleSnapshot::read(&self.inner, MarketId::perp(market_index))
+            .map(|oracle| oracle.to_dict(py))
+            .transpose()
     }
 
     fn get_spot_oracle(&self, py: Python<'_>, market_index: u16) -> PyResult<Option<Py<PyAny>>> {
-        match self
-            .inner
-            .try_get_oracle_price_data_and_slot(drift_rs::types::MarketId::spot(market_index))
-        {
-            Some(oracle) => {
-                let dict = pyo3::types::PyDict::new(py);
-                dict.set_item("price", oracle.data.price)?;
-                dict.set_item("confidence", oracle.data.confidence)?;
-                dict.set_item("delay", oracle.data.delay)?;
-                dict.set_item("slot", oracle.slot)?;
-                Ok(Some(dict.into_any().unbind()))
-            }
-            None => Ok(None),
-        }
+        OracleSnapshot::read(&self.inner, MarketId::spot(market_index))
+            .map(|oracle| oracle.to_dict(py))
+            .transpose()
+    }
+
+    /// Wait for the perp oracle to update past `since_slot` (async)
+    ///
+    /// Resolves with the same dict as get_perp_oracle() once the cache holds
+    /// a price from a slot after `since_slot`. Pass the previous result's
+    /// `slot` to wait for the next update. Each call re-checks the cache on
+    /// its own 50ms interval until then. Raises ValueError for a market the
+    /// client doesn't know, and TimeoutError if `timeout` seconds pass without
+    /// an update.
+    ///
+    /// Example:
+    ///     ```python
+    ///     oracle = await client.wait_for_perp_oracle_update(0)
+    ///     oracle = await client.wait_for_perp_oracle_update(0, oracle["slot"], timeout=5.0)
+    ///     ```
+    #[pyo3(signature = (market_index, since_slot=0, timeout=None))]
+    fn wait_for_perp_oracle_update<'py>(
+        &self,
+        py: Python<'py>,
+        market_index: u16,
+        since_slot: u64,
+        timeout: Option<f64>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let market = self.perp_market_id(market_index)?;
+        let inner = Arc::clone(&self.inner);
+        let timeout = timeout
+            .map(Duration::try_from_secs_f64)
+            .transpose()
+            .map_err(|e| {
+                pyo3::exceptions::PyValueError::new_err(format!("Invalid timeout: {}", e))
+            })?;
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let update = next_oracle_update(&inner, market, since_slot);
+            let oracle = match timeout {
+                Some(timeout) => tokio::time::timeout(timeout, update).await.map_err(|_| {
+                    pyo3::exceptions::PyTimeoutError::new_err(format!(
+                        "No oracle update for perp market {} after slot {}",
+                        market_index, since_slot
+                    ))
+                })?,
+                None => update.await,
+            };
+            Python::attach(|py| oracle.to_dict(py))
+        })
     }
 
+    /// Stream oracle updates for a perp market
+    ///
+    /// Returns an async iterator yielding the same dicts as get_perp_oracle(),
+    /// one per new oracle slot, starting with the current cached value. Each
+    /// stream polls the cache on its own interval, like
+    /// wait_for_perp_oracle_update(), so a slot that changes between polls is
+    /// skipped. Raises ValueError for a market the client doesn't know.
+    ///
+    /// Example:
+    ///     ```python
+    ///     async for oracle in client.perp_oracle_stream(0):
+    ///         print(oracle["price"], oracle["slot"])
+    ///     ```
+    fn perp_oracle_stream(&self, market_index: u16) -> PyResult<OracleStream> {
+        Ok(OracleStream {
+            inner: Arc::clone(&self.inner),
+            market: self.perp_market_id(market_index)?,
+            last_slot: Arc::new(tokio::sync::Mutex::new(0)),
+        })
+    }
+
+    /// Get a perp market from the cache as a read-only PerpMarketView.
+    ///
+    /// The view is shared between calls until the market account changes.
     fn get_perp_market(&self, py: Python<'_>, market_index: u16) -> PyResult<Option<Py<PyAny>>> {
         match self.inner.try_get_perp_market_account(market_index) {
-            Ok(market) => {
-                let obj = pythonize(py, &market).map_err(|e| {
-                    pyo3::exceptions::PyRuntimeError::new_err(format!(
-                        "Failed to serialize perp market: {}",
-                        e
-                    ))
-                })?;
-                Ok(Some(obj.unbind()))
-            }
+            Ok(market) => cached_market_object(
+                py,
+                &self.perp_market_objects,
+                market_index,
+                market,
+                build_perp_market_view,
+            )
+            .map(Some),
             Err(_) => Ok(None),
         }
     }
 
+    /// Get the AMM price of a perp market from the cache,
+    /// `quote_asset_reserve * peg_multiplier / base_asset_reserve`.
+    ///
+    /// Reads the reserves straight from the cached account without building a
+    /// dict. Returns None if the market isn't in the cache or its base asset
+    /// reserve is zero (no price).
+    fn get_perp_amm_price(&self, market_index: u16) -> Option<f64> {
+        let market = self.inner.try_get_perp_market_account(market_index).ok()?;
+        let quote_asset_reserve = u128::from(market.amm.quote_asset_reserve);
+        let peg_multiplier = u128::from(market.amm.peg_multiplier);
+        let base_asset_reserve = u128::from(market.amm.base_asset_reserve);
+        if base_asset_reserve == 0 {
+            return None;
+        }
+
+        let quote_value = match quote_asset_reserve.checked_mul(peg_multiplier) {
+            Some(quote_value) => quote_value as f64,
+            None => quote_asset_reserve as f64 * peg_multiplier as f64,
+        };
+        Some(quote_value / base_asset_reserve as f64)
+    }
+
+    /// Get several perp markets from the cache in one call.
+    ///
+    /// Returns a list of PerpMarketViews aligned with `market_indexes`, with
+    /// `None` for markets that aren't in the cache. The cache lookups run with
+    /// the GIL released.
+    fn get_perp_markets(
+        &self,
+        py: Python<'_>,
+        market_indexes: Vec<u16>,
+    ) -> PyResult<Vec<Option<Py<PyAny>>>> {
+        let inner = Arc::clone(&self.inner);
+        let markets: Vec<_> = py.detach(move || {
+            market_indexes
+                .into_iter()
+                .map(|market_index| {
+                    (
+                        market_index,
+                        inner.try_get_perp_market_account(market_index).ok(),
+                    )
+                })
+                .collect()
+        });
+
+        markets
+            .into_iter()
+            .map(|(market_index, market)| {
+                market
+                    .map(|market| {
+                        cached_market_object(
+                            py,
+                            &self.perp_market_objects,
+                            market_index,
+                            market,
+                            build_perp_market_view,
+                        )
+                    })
+                    .transpose()
+            })
+            .collect()
+    }
+
+    /// Get a spot market from the cache as a new dict.
     fn get_spot_market(&self, py: Python<'_>, market_index: u16) -> PyResult<Option<Py<PyAny>>> {
         match self.inner.try_get_spot_market_account(market_index) {
-            Ok(market) => {
-                let obj = pythonize(py, &market).map_err(|e| {
-                    pyo3::exceptions::PyRuntimeError::new_err(format!(
-                        "Failed to serialize spot market: {}",
-                        e
-                    ))
-                })?;
-                Ok(Some(obj.unbind()))
-            }
+            Ok(market) => pythonize_market(py, &market, "spot").map(Some),
             Err(_) => Ok(None),
         }
     }
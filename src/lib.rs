@@ -1,10 +1,13 @@
 use pyo3::prelude::*;
+use std::sync::OnceLock;
 
 pub mod addresses;
 pub mod async_test;
+pub mod batch;
 pub mod cache_demo;
 pub mod constants;
 pub mod drift_client;
+pub mod market_view;
 pub mod math;
 pub mod pyth_lazer;
 pub mod utils;
@@ -33,10 +36,38 @@ fn init_observability() {
     });
 }
 
+/// The single Tokio runtime shared by every `future_into_py` call and
+/// background task in the extension.
+static RUNTIME: OnceLock<tokio::runtime::Runtime> = OnceLock::new();
+
+fn init_runtime() -> PyResult<()> {
+    if RUNTIME.get().is_some() {
+        return Ok(());
+    }
+
+    // Worker count defaults to the number of available cores
+    let runtime = tokio::runtime::Builder::new_multi_thread()
+        .enable_all()
+        .thread_name("driftpyrs-worker")
+        .build()
+        .map_err(|e| {
+            pyo3::exceptions::PyRuntimeError::new_err(format!(
+                "Failed to start Tokio runtime: {}",
+                e
+            ))
+        })?;
+    let runtime = RUNTIME.get_or_init(|| runtime);
+
+    // Only fails if pyo3-async-runtimes already has a runtime, which is then
+    // the one in use
+    let _ = pyo3_async_runtimes::tokio::init_with_runtime(runtime);
+    Ok(())
+}
+
 #[pymodule]
 fn _driftpyrs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     init_observability();
-    let _ = pyo3_async_runtimes::tokio::get_runtime();
+    init_runtime()?;
 
     m.add_function(wrap_pyfunction!(constants::get_program_id, m)?)?;
     m.add_function(wrap_pyfunction!(constants::get_vault_program_id, m)?)?;
@@ -54,6 +85,7 @@ fn _driftpyrs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(constants::derive_drift_signer, m)?)?;
 
     m.add_function(wrap_pyfunction!(addresses::derive_user_account, m)?)?;
+    m.add_function(wrap_pyfunction!(addresses::derive_user_accounts, m)?)?;
     m.add_function(wrap_pyfunction!(addresses::derive_stats_account, m)?)?;
     m.add_function(wrap_pyfunction!(addresses::derive_swift_order_account, m)?)?;
     m.add_function(wrap_pyfunction!(addresses::derive_pyth_lazer_oracle, m)?)?;
@@ -74,10 +106,15 @@ fn _driftpyrs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(utils::debug_current_thread, m)?)?;
     m.add_function(wrap_pyfunction!(utils::build_info, m)?)?;
 
+    m.add_function(wrap_pyfunction!(batch::batch, m)?)?;
+
     m.add_function(wrap_pyfunction!(async_test::sleep_and_return, m)?)?;
+    m.add_function(wrap_pyfunction!(async_test::sleep_and_return_batch, m)?)?;
 
     m.add_class::<cache_demo::CacheDemo>()?;
     m.add_class::<drift_client::DriftClient>()?;
+    m.add_class::<drift_client::OracleStream>()?;
+    m.add_class::<market_view::PerpMarketView>()?;
 
     let pyth_lazer = PyModule::new(m.py(), "pyth_lazer")?;
     pyth_lazer.add_function(wrap_pyfunction!(
@@ -0,0 +1,201 @@
+use drift_rs::types::accounts::PerpMarket;
+use pyo3::prelude::*;
+use pyo3::sync::PyOnceLock;
+use pyo3::types::{PyDict, PyIterator, PyList, PyString, PyTuple};
+use pythonize::pythonize;
+use serde::Serialize;
+
+/// Convert a market account into a Python dict.
+pub(crate) fn pythonize_market<T: Serialize>(
+    py: Python<'_>,
+    market: &T,
+    kind: &str,
+) -> PyResult<Py<PyAny>> {
+    pythonize(py, market).map(|obj| obj.unbind()).map_err(|e| {
+        pyo3::exceptions::PyRuntimeError::new_err(format!(
+            "Failed to serialize {} market: {}",
+            kind, e
+        ))
+    })
+}
+
+/// Copy the dicts, lists and tuples inside a pythonized value, so callers
+/// can't modify the cached original. Scalars are immutable and shared as-is.
+fn detached(value: Bound<'_, PyAny>) -> PyResult<Bound<'_, PyAny>> {
+    let py = value.py();
+    if let Ok(dict) = value.cast::<PyDict>() {
+        let copy = PyDict::new(py);
+        for (key, item) in dict.iter() {
+            copy.set_item(key, detached(item)?)?;
+        }
+        Ok(copy.into_any())
+    } else if let Ok(list) = value.cast::<PyList>() {
+        let items = list.iter().map(detached).collect::<PyResult<Vec<_>>>()?;
+        Ok(PyList::new(py, items)?.into_any())
+    } else if let Ok(tuple) = value.cast::<PyTuple>() {
+        let items = tuple.iter().map(detached).collect::<PyResult<Vec<_>>>()?;
+        Ok(PyTuple::new(py, items)?.into_any())
+    } else {
+        Ok(value)
+    }
+}
+
+/// Read-only mapping over a cached perp market account.
+///
+/// Has the same keys as the pythonized `PerpMarket`. `market_index` and the
+/// nested `amm` dict are converted straight from the account on first access;
+/// any other key, iteration, `len()` or `as_dict()` builds the full dict once
+/// and keeps it. Views are shared between `get_perp_market` callers, so nested
+/// dicts and lists are handed out as copies.
+///
+/// Example:
+///     ```python
+///     market = client.get_perp_market(0)
+///     market["amm"]["last_funding_rate"]  # converts just the AMM
+///     market.as_dict()                      # a copy of the full dict
+///     ```
+#[pyclass(frozen, mapping)]
+pub struct PerpMarketView {
+    market: PerpMarket,
+    dict: PyOnceLock<Py<PyDict>>,
+    amm: PyOnceLock<Py<PyAny>>,
+}
+
+impl PerpMarketView {
+    pub(crate) fn new(market: PerpMarket) -> Self {
+        Self {
+            market,
+            dict: PyOnceLock::new(),
+            amm: PyOnceLock::new(),
+        }
+    }
+
+    fn dict<'py>(&self, py: Python<'py>) -> PyResult<&Bound<'py, PyDict>> {
+        self.dict
+            .get_or_try_init(py, || {
+                pythonize_market(py, &self.market, "perp")?
+                    .into_bound(py)
+                    .cast_into::<PyDict>()
+                    .map(Bound::unbind)
+                    .map_err(PyErr::from)
+            })
+            .map(|dict| dict.bind(py))
+    }
+
+    /// The nested AMM dict, taken from the full dict if that's already built.
+    fn amm<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        if let Some(dict) = self.dict.get(py) {
+            if let Some(amm) = dict.bind(py).get_item("amm")? {
+                return Ok(amm);
+            }
+        }
+        self.amm
+            .get_or_try_init(py, || {
+                pythonize(py, &self.market.amm)
+                    .map(Bound::unbind)
+                    .map_err(|e| {
+                        pyo3::exceptions::PyRuntimeError::new_err(format!(
+                            "Failed to serialize perp market amm: {}",
+                            e
+                        ))
+                    })
+            })
+            .map(|amm| amm.bind(py).clone())
+    }
+
+    /// Look up `key` like a dict would; keys that aren't field names are
+    /// missing rather than an error.
+    fn lookup<'py>(
+        &self,
+        py: Python<'py>,
+        key: &Bound<'py, PyAny>,
+    ) -> PyResult<Option<Bound<'py, PyAny>>> {
+        if let Ok(name) = key.cast::<PyString>() {
+            match name.to_cow().ok().as_deref() {
+                Some("market_index") => {
+                    return Ok(Some(self.market.market_index.into_pyobject(py)?.into_any()));
+                }
+                Some("amm") => return self.amm(py).map(Some),
+                _ => {}
+            }
+        }
+        self.dict(py)?.get_item(key)
+    }
+}
+
+#[pymethods]
+impl PerpMarketView {
+    fn __getitem__<'py>(
+        &self,
+        py: Python<'py>,
+        key: &Bound<'py, PyAny>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        match self.lookup(py, key)? {
+            Some(value) => detached(value),
+            // Wrapped in a tuple so a tuple key isn't unpacked into the args
+            None => {
+                let key = key.clone().unbind();
+                Err(pyo3::exceptions::PyKeyError::new_err((key,)))
+            }
+        }
+    }
+
+    #[pyo3(signature = (key, default=None))]
+    fn get<'py>(
+        &self,
+        py: Python<'py>,
+        key: &Bound<'py, PyAny>,
+        default: Option<Bound<'py, PyAny>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        match self.lookup(py, key)? {
+            Some(value) => detached(value),
+            None => Ok(default.unwrap_or_else(|| py.None().into_bound(py))),
+        }
+    }
+
+    fn __contains__(&self, py: Python<'_>, key: &Bound<'_, PyAny>) -> PyResult<bool> {
+        self.dict(py)?.contains(key)
+    }
+
+    fn __len__(&self, py: Python<'_>) -> PyResult<usize> {
+        Ok(self.dict(py)?.len())
+    }
+
+    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyIterator>> {
+        self.dict(py)?.try_iter()
+    }
+
+    fn keys<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        self.dict(py)?.call_method0("keys")
+    }
+
+    /// Get the values as a list; nested dicts and lists are copies.
+    fn values<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        let values = self
+            .dict(py)?
+            .values()
+            .iter()
+            .map(detached)
+            .collect::<PyResult<Vec<_>>>()?;
+        PyList::new(py, values)
+    }
+
+    /// Get the `(key, value)` pairs as a list; nested dicts and lists are copies.
+    fn items<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        let items = self
+            .dict(py)?
+            .iter()
+            .map(|(key, value)| Ok((key, detached(value)?)))
+            .collect::<PyResult<Vec<_>>>()?;
+        PyList::new(py, items)
+    }
+
+    /// Get the full market as a new dict, safe to modify at any depth.
+    fn as_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        detached(self.dict(py)?.clone().into_any())
+    }
+
+    fn __repr__(&self) -> String {
+        format!("PerpMarketView(market_index={})", self.market.market_index)
+    }
+}
@@ -1,31 +1,28 @@
 use drift_rs::types::PositionDirection;
 use pyo3::prelude::*;
 
+/// Parse `"long"`/`"short"` (any case) without allocating a lowercased copy.
+pub(crate) fn parse_direction(direction: &str) -> PyResult<PositionDirection> {
+    if direction.eq_ignore_ascii_case("long") {
+        Ok(PositionDirection::Long)
+    } else if direction.eq_ignore_ascii_case("short") {
+        Ok(PositionDirection::Short)
+    } else {
+        Err(pyo3::exceptions::PyValueError::new_err(
+            "direction must be 'long' or 'short'",
+        ))
+    }
+}
+
 #[pyfunction]
 pub fn standardize_price(price: u64, tick_size: u64, direction: &str) -> PyResult<u64> {
-    let dir = match direction.to_lowercase().as_str() {
-        "long" => PositionDirection::Long,
-        "short" => PositionDirection::Short,
-        _ => {
-            return Err(pyo3::exceptions::PyValueError::new_err(
-                "direction must be 'long' or 'short'",
-            ))
-        }
-    };
+    let dir = parse_direction(direction)?;
     Ok(drift_rs::math::standardize_price(price, tick_size, dir))
 }
 
 #[pyfunction]
 pub fn standardize_price_i64(price: i64, tick_size: u64, direction: &str) -> PyResult<i64> {
-    let dir = match direction.to_lowercase().as_str() {
-        "long" => PositionDirection::Long,
-        "short" => PositionDirection::Short,
-        _ => {
-            return Err(pyo3::exceptions::PyValueError::new_err(
-                "direction must be 'long' or 'short'",
-            ))
-        }
-    };
+    let dir = parse_direction(direction)?;
     Ok(drift_rs::math::standardize_price_i64(price, tick_size, dir))
 }
 